@@ -26,6 +26,9 @@ SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 30
 
+# 3D Settings
+MODEL_CACHE_DIR = "~/.cache/pemberton_manor/models"  # Prepared GLB geometry (None to disable)
+
 # Debug Settings
 DEBUG_MODE = False
 SHOW_CHARACTER_SECRETS = False  # Reveal secrets in debug mode
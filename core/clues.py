@@ -19,7 +19,7 @@ class ClueCategory(Enum):
     RELATIONSHIP = "relationship"
 
 
-@dataclass
+@dataclass(slots=True)
 class Clue:
     """Represents a discoverable clue."""
     id: str
@@ -18,6 +18,39 @@ from llm import (
 import config
 
 
+# Names, surnames and list numbers the player may use to pick a suspect
+SUSPECT_ALIASES = {
+    "major": "major", "blackwood": "major", "1": "major",
+    "lady": "lady", "cordelia": "lady", "ashworth": "lady", "2": "lady",
+    "maid": "maid", "molly": "maid", "finch": "maid", "3": "maid",
+    "student": "student", "thomas": "student", "whitmore": "student", "4": "student",
+}
+
+# Keywords that mark a potential clue in a conversation with each suspect
+CLUE_KEYWORDS = {
+    "major": ("letter opener", "argument", "debt", "crimea"),
+    "lady": ("10:45", "after", "corridor", "shiny", "desperate"),
+    "maid": ("saw", "corridor", "10:50", "distressed", "mistress"),
+    "student": ("advances", "improper", "confronted", "threatened"),
+}
+
+# Commands that end the game, or leave the current conversation
+QUIT_COMMANDS = ("quit", "exit game", "end")
+BACK_COMMANDS = ("back", "exit", "done", "leave")
+
+
+def _match_suspect(selection: str) -> Optional[str]:
+    """Map a typed name, surname or number to a suspect ID."""
+    # Exact aliases ("molly", "3") are a single dict lookup; only free-form
+    # input like "the maid" needs the substring scan
+    char_id = SUSPECT_ALIASES.get(selection)
+    if char_id is None:
+        char_id = next(
+            (cid for key, cid in SUSPECT_ALIASES.items() if key in selection), None
+        )
+    return char_id
+
+
 class GameState(Enum):
     """Possible states of the game."""
     NOT_STARTED = "not_started"
@@ -112,19 +145,11 @@ class GameEngine:
             pass
 
         # Handle name-based selection
-        char_mapping = {
-            "major": "major", "blackwood": "major", "1": "major",
-            "lady": "lady", "cordelia": "lady", "ashworth": "lady", "2": "lady",
-            "maid": "maid", "molly": "maid", "finch": "maid", "3": "maid",
-            "student": "student", "thomas": "student", "whitmore": "student", "4": "student",
-        }
-
-        for key, char_id in char_mapping.items():
-            if key in selection:
-                char = get_character(char_id)
-                if char:
-                    self.session.current_character = char_id
-                    return True, f"\n{char.title} {char.name} regards you with {'suspicion' if char.is_guilty else 'interest'}.\n\nWhat would you like to ask?"
+        char_id = _match_suspect(selection)
+        char = get_character(char_id) if char_id else None
+        if char:
+            self.session.current_character = char_id
+            return True, f"\n{char.title} {char.name} regards you with {'suspicion' if char.is_guilty else 'interest'}.\n\nWhat would you like to ask?"
 
         return False, "Invalid selection. Please choose a suspect by number or name."
 
@@ -146,7 +171,7 @@ class GameEngine:
             return "Invalid character."
 
         # Check for back/exit commands
-        if question.strip().lower() in ["back", "exit", "done", "leave"]:
+        if question.strip().lower() in BACK_COMMANDS:
             self.session.current_character = None
             return self.get_character_list()
 
@@ -169,15 +194,8 @@ class GameEngine:
     def _detect_clues(self, char_id: str, question: str, response: str):
         """Detect and record potential clues from conversation."""
         # This is a simplified clue detection - could be enhanced with NLP
-        clue_keywords = {
-            "major": ["letter opener", "argument", "debt", "crimea"],
-            "lady": ["10:45", "after", "corridor", "shiny", "desperate"],
-            "maid": ["saw", "corridor", "10:50", "distressed", "mistress"],
-            "student": ["advances", "improper", "confronted", "threatened"],
-        }
-
         combined_text = (question + response).lower()
-        for keyword in clue_keywords.get(char_id, []):
+        for keyword in CLUE_KEYWORDS.get(char_id, ()):
             if keyword in combined_text:
                 clue = f"{char_id}: mentioned '{keyword}'"
                 if clue not in self.session.clues_discovered:
@@ -205,18 +223,7 @@ class GameEngine:
         selection = selection.strip().lower()
 
         # Map selection to character ID
-        char_mapping = {
-            "1": "major", "major": "major", "blackwood": "major",
-            "2": "lady", "lady": "lady", "cordelia": "lady", "ashworth": "lady",
-            "3": "maid", "maid": "maid", "molly": "maid", "finch": "maid",
-            "4": "student", "student": "student", "thomas": "student", "whitmore": "student",
-        }
-
-        accused_id = None
-        for key, char_id in char_mapping.items():
-            if key in selection:
-                accused_id = char_id
-                break
+        accused_id = _match_suspect(selection)
 
         if accused_id is None:
             return "Invalid accusation. Please choose a suspect by number or name."
@@ -270,38 +277,72 @@ TIPS:
   - Note who seems nervous or evasive
 """
 
-    def process_input(self, user_input: str) -> str:
-        """Process any user input and return appropriate response."""
+    def _route_input(self, user_input: str) -> str:
+        """
+        Decide how process_input handles (stripped, lower-cased) input.
+
+        Returns one of: "new_game", "help", "status", "quit",
+        "introduction", "select", "leave", "question", "accusation",
+        "game_over" or "unknown". Only "question" reaches the LLM.
+        """
         if self.session is None:
-            return self.start_new_game() + self.get_character_list()
+            return "new_game"
+
+        # Global commands
+        if user_input in ("help", "status"):
+            return user_input
+        if user_input in QUIT_COMMANDS:
+            return "quit"
+
+        # State-specific input
+        if self.session.state == GameState.INTRODUCTION:
+            return "introduction"
+        elif self.session.state == GameState.INVESTIGATING:
+            if self.session.current_character is None:
+                return "select"
+            if user_input in BACK_COMMANDS:
+                return "leave"
+            return "question"
+        elif self.session.state == GameState.ACCUSATION:
+            return "accusation"
+        elif self.session.state == GameState.GAME_OVER:
+            return "game_over"
 
+        return "unknown"
+
+    def process_input(self, user_input: str) -> str:
+        """Process any user input and return appropriate response."""
         user_input = user_input.strip().lower()
+        route = self._route_input(user_input)
+
+        if route == "new_game":
+            return self.start_new_game() + self.get_character_list()
 
         # Handle global commands
-        if user_input == "help":
+        if route == "help":
             return self.get_help()
-        elif user_input == "status":
+        elif route == "status":
             return self.get_status()
-        elif user_input in ["quit", "exit game", "end"]:
+        elif route == "quit":
             self.session.state = GameState.GAME_OVER
             return "Thank you for playing! The mystery remains unsolved..."
 
         # Handle state-specific input
-        if self.session.state == GameState.INTRODUCTION:
+        if route == "introduction":
             self.session.state = GameState.INVESTIGATING
             return self.get_character_list()
-
-        elif self.session.state == GameState.INVESTIGATING:
-            if self.session.current_character is None:
-                success, message = self.select_character(user_input)
-                return message
-            else:
-                return self.ask_question(user_input)
-
-        elif self.session.state == GameState.ACCUSATION:
+        elif route == "select":
+            success, message = self.select_character(user_input)
+            return message
+        elif route in ("leave", "question"):
+            return self.ask_question(user_input)
+        elif route == "accusation":
             return self._handle_accusation(user_input)
-
-        elif self.session.state == GameState.GAME_OVER:
+        elif route == "game_over":
             return "Game over. Start a new game to play again."
 
         return "Unknown game state."
+
+    def will_query_llm(self, user_input: str) -> bool:
+        """Whether process_input would send this input to the LLM."""
+        return self._route_input(user_input.strip().lower()) == "question"
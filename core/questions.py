@@ -15,7 +15,7 @@ class QuestionCategory(Enum):
     UNLOCKABLE = "unlockable"  # Appears after certain clues discovered
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """Represents a question the detective can ask."""
     id: str
@@ -37,7 +37,7 @@ class Question:
         return self.is_active
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """A scripted response from a suspect."""
     text: str
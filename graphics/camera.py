@@ -156,9 +156,6 @@ class CameraSystem:
 
         base_path = os.path.dirname(os.path.abspath(__file__))
 
-        # Check what custom assets are available
-        available = check_for_custom_assets(base_path)
-
         # Load background
         bg_path = os.path.join(base_path, "assets/backgrounds/drawing_room.jpg")
         if os.path.exists(bg_path):
@@ -8,11 +8,22 @@ from panda3d.core import (
     WindowProperties, AmbientLight, DirectionalLight, PointLight,
     CardMaker, Vec3, Point3, NodePath, Texture, TransparencyAttrib,
     GeomNode, Geom, GeomVertexData, GeomVertexFormat,
-    GeomTriangles, GeomVertexWriter
+    GeomTriangles
 )
 from direct.interval.LerpInterval import LerpHprInterval
+import gc
+import hashlib
 import math
 import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+
+
+# Bump when the prepared arrays change to invalidate cached models
+MODEL_CACHE_VERSION = 2
 
 
 # Character configuration
@@ -51,6 +62,9 @@ CHARACTER_CONFIG = {
 class Scene3D:
     """3D Victorian library scene with table and characters."""
 
+    # Registered vertex format shared by every character model
+    _V3N3_FORMAT = GeomVertexFormat.getV3n3()
+
     def __init__(self, base: ShowBase):
         """
         Initialize the 3D scene.
@@ -119,8 +133,105 @@ class Scene3D:
 
         print("✓ Table created")
 
-    def _load_model_with_trimesh(self, model_path):
-        """Load GLB using trimesh and convert to Panda3D geometry."""
+    def _prepare_model_arrays(self, model_path):
+        """
+        Get Panda3D-ready arrays for a GLB, from the disk cache if possible.
+
+        Only uses trimesh and numpy, so it is safe to run off the main thread.
+
+        Returns:
+            ((interleaved V3N3 float32 vertices, uint16/uint32 triangle
+            indices) or None if the model could not be loaded, whether
+            trimesh had to parse the file because it was not cached)
+        """
+        cache_path = self._model_cache_path(model_path)
+        if cache_path and os.path.exists(cache_path):
+            try:
+                import numpy as np
+                with np.load(cache_path) as cached:
+                    arrays = cached['vertices'], cached['indices']
+                print(f"  Loaded {model_path} from cache")
+                return arrays, False
+            except Exception as e:
+                print(f"  Ignoring unreadable model cache {cache_path}: {e}")
+
+        arrays = self._parse_model_arrays(model_path)
+        if arrays is not None and cache_path:
+            self._write_model_cache(cache_path, *arrays)
+        return arrays, True
+
+    def _model_cache_path(self, model_path):
+        """
+        Cache file for a model, keyed on its path, mtime and size.
+
+        Names are "<path digest>-<version digest>.npz", so every entry for
+        one model shares a prefix and older versions can be found and
+        removed when a new one is written.
+        """
+        if not config.MODEL_CACHE_DIR:
+            return None
+        try:
+            st = os.stat(model_path)
+        except OSError:
+            return None
+        path_digest = hashlib.blake2b(
+            os.path.abspath(model_path).encode(), digest_size=8
+        ).hexdigest()
+        version_digest = hashlib.blake2b(
+            f"{MODEL_CACHE_VERSION}:{st.st_mtime_ns}:{st.st_size}".encode(), digest_size=8
+        ).hexdigest()
+        return os.path.join(
+            os.path.expanduser(config.MODEL_CACHE_DIR), f"{path_digest}-{version_digest}.npz"
+        )
+
+    def _write_model_cache(self, cache_path, interleaved, indices):
+        """Save prepared arrays; a failed write only costs the next load."""
+        import numpy as np
+        cache_dir, cache_name = os.path.split(cache_path)
+        # Write to a temporary name so a concurrent reader never sees
+        # a half-written file
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, vertices=interleaved, indices=indices)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"  Could not write model cache {cache_path}: {e}")
+            return
+        finally:
+            # Only a failed write leaves the temporary file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+        # Drop entries left by older versions of the same model file
+        prefix = cache_name.split('-', 1)[0] + '-'
+        try:
+            for name in os.listdir(cache_dir):
+                if name.startswith(prefix) and name.endswith('.npz') and name != cache_name:
+                    os.remove(os.path.join(cache_dir, name))
+        except OSError as e:
+            print(f"  Could not prune model cache {cache_dir}: {e}")
+
+    @staticmethod
+    def _stored_vertex_normals(mesh):
+        """
+        Get the vertex normals a mesh was loaded with, or None.
+
+        mesh.vertex_normals computes (and keeps) a set of its own when the
+        file has none, so the normals trimesh read from the file are taken
+        from its private mesh cache instead. Checked against trimesh 5.1.1;
+        without that cache this falls back to the public property.
+        """
+        cache = getattr(mesh, '_cache', None)
+        if cache is None:
+            return mesh.vertex_normals
+        return cache['vertex_normals']
+
+    def _parse_model_arrays(self, model_path):
+        """Load GLB using trimesh and pack it into Panda3D-ready arrays."""
         try:
             import trimesh
             import numpy as np
@@ -129,153 +240,230 @@ class Scene3D:
             return None
 
         try:
-            # Load with trimesh
-            scene = trimesh.load(model_path)
+            # Load with trimesh - only geometry is used, so skip vertex
+            # processing and material/texture decoding entirely
+            scene = trimesh.load(
+                model_path, force='scene', process=False, skip_materials=True
+            )
             print(f"  Loaded with trimesh: {type(scene)}")
 
-            # Collect all valid meshes
-            all_vertices = []
-            all_normals = []
-            all_faces = []
-            vertex_offset = 0
-
-            # Get meshes from scene
-            if isinstance(scene, trimesh.Scene):
-                meshes = list(scene.geometry.values())
-                print(f"  Scene has {len(meshes)} geometry objects")
-            else:
-                meshes = [scene]
-
+            # Get meshes from scene, skipping non-mesh objects (like
+            # PointCloud, Path, etc.) once up front
+            geometry = list(scene.geometry.values())
+            meshes = [g for g in geometry if isinstance(g, trimesh.Trimesh)]
+            print(f"  Scene has {len(geometry)} geometry objects")
+            if len(meshes) != len(geometry):
+                print(f"    Skipping {len(geometry) - len(meshes)} non-mesh objects")
+
+            # First pass picks the meshes to merge, so the output buffers can
+            # be allocated once at their final size
+            valid_meshes = []
             for mesh_idx, mesh in enumerate(meshes):
-                # Skip non-mesh objects (like PointCloud, Path, etc.)
-                if not hasattr(mesh, 'vertices') or not hasattr(mesh, 'faces'):
-                    print(f"    Mesh {mesh_idx}: skipping (no vertices/faces)")
-                    continue
-
-                verts = np.array(mesh.vertices)
-                faces = np.array(mesh.faces)
+                verts = np.asarray(mesh.vertices)
 
-                if len(verts) == 0 or len(faces) == 0:
+                if len(verts) == 0 or len(mesh.faces) == 0:
                     print(f"    Mesh {mesh_idx}: empty")
                     continue
 
-                # Check for invalid values
-                if np.any(~np.isfinite(verts)):
-                    print(f"    Mesh {mesh_idx}: has inf/nan vertices, skipping")
-                    continue
-
-                print(f"    Mesh {mesh_idx}: {len(verts)} verts, {len(faces)} faces, bounds: {verts.min(axis=0)} to {verts.max(axis=0)}")
+                # Per-mesh bounds cost two full reductions; only pay for them when debugging
+                if config.DEBUG_MODE:
+                    print(f"    Mesh {mesh_idx}: {len(verts)} verts, {len(mesh.faces)} faces, bounds: {verts.min(axis=0)} to {verts.max(axis=0)}")
+
+                valid_meshes.append((mesh_idx, mesh))
+
+            # Swap Y and Z for Panda3D (GLB Z-up -> Panda3D Y-forward)
+            swap = [0, 2, 1]
+
+            while True:
+                if not valid_meshes:
+                    print("  ERROR: No valid meshes found")
+                    return None
+
+                total_verts = sum(len(mesh.vertices) for _, mesh in valid_meshes)
+                total_faces = sum(len(mesh.faces) for _, mesh in valid_meshes)
+
+                # 16-bit indices halve the index buffer when they can address
+                # every vertex
+                index_dtype = np.uint16 if total_verts < 65536 else np.uint32
+
+                # V3N3 is a single interleaved float32 array (x y z nx ny nz)
+                # that is copied into the vertex buffer in one go. Positions
+                # are gathered separately first because they still need
+                # centering.
+                vertices = np.empty((total_verts, 3), dtype=np.float32)
+                faces = np.empty((total_faces, 3), dtype=index_dtype)
+                interleaved = np.empty((total_verts, 6), dtype=np.float32)
+                vertex_starts = np.empty(len(valid_meshes), dtype=np.int64)
+
+                # Second pass copies each mesh straight into its slice,
+                # narrowing to float32 and offsetting faces on the way
+                vertex_offset = 0
+                face_offset = 0
+                for i, (_, mesh) in enumerate(valid_meshes):
+                    v_end = vertex_offset + len(mesh.vertices)
+                    f_end = face_offset + len(mesh.faces)
+                    vertex_starts[i] = vertex_offset
+
+                    vertices[vertex_offset:v_end] = mesh.vertices
+                    np.add(mesh.faces, vertex_offset,
+                           out=faces[face_offset:f_end], casting='unsafe')
+
+                    # Use the normals stored in the file, if any
+                    file_normals = self._stored_vertex_normals(mesh)
+                    if file_normals is not None:
+                        interleaved[vertex_offset:v_end, 3:] = np.asarray(file_normals)[:, swap]
+                    else:
+                        # Sum area-weighted face normals onto each corner
+                        tris = vertices[vertex_offset:v_end][mesh.faces]
+                        face_normals = np.cross(tris[:, 1] - tris[:, 0],
+                                                tris[:, 2] - tris[:, 0])
+                        normals = np.zeros((v_end - vertex_offset, 3))
+                        np.add.at(normals, np.asarray(mesh.faces).ravel(),
+                                  np.repeat(face_normals, 3, axis=0))
+                        normals /= np.linalg.norm(normals, axis=1, keepdims=True).clip(1e-12)
+                        interleaved[vertex_offset:v_end, 3:] = normals[:, swap]
+
+                    vertex_offset = v_end
+                    face_offset = f_end
+
+                # Check for invalid values once over the merged buffer; bad
+                # data is rare, so only then work out which meshes to drop
+                # and merge again without them
+                if np.isfinite(vertices).all():
+                    break
+                bad_rows = np.flatnonzero(~np.isfinite(vertices).all(axis=1))
+                bad = set(np.searchsorted(vertex_starts, bad_rows, side='right') - 1)
+                for i in sorted(bad):
+                    print(f"    Mesh {valid_meshes[i][0]}: has inf/nan vertices, skipping")
+                valid_meshes = [m for i, m in enumerate(valid_meshes) if i not in bad]
 
-                # Get normals
-                if hasattr(mesh, 'vertex_normals') and mesh.vertex_normals is not None:
-                    norms = np.array(mesh.vertex_normals)
-                else:
-                    norms = np.zeros_like(verts)
-                    norms[:, 2] = 1.0
-
-                # Offset faces for concatenation
-                offset_faces = faces + vertex_offset
+            print(f"  Combined: {len(vertices)} verts, {len(faces)} faces")
+            if config.DEBUG_MODE:
+                print(f"  Bounds: {vertices.min(axis=0)} to {vertices.max(axis=0)}")
 
-                all_vertices.append(verts)
-                all_normals.append(norms)
-                all_faces.append(offset_faces)
-                vertex_offset += len(verts)
+            # Accumulate in float64 so the center doesn't drift on big meshes
+            center = vertices.mean(axis=0, dtype=np.float64)
 
-            if not all_vertices:
-                print("  ERROR: No valid meshes found")
-                return None
+            # Center at origin, writing straight into the float32 columns
+            np.subtract(vertices[:, swap], center[swap],
+                        out=interleaved[:, :3], casting='same_kind')
 
-            # Concatenate all meshes
-            vertices = np.vstack(all_vertices)
-            normals = np.vstack(all_normals)
-            faces = np.vstack(all_faces)
+            indices = faces.ravel()
 
-            print(f"  Combined: {len(vertices)} verts, {len(faces)} faces")
-            print(f"  Bounds: {vertices.min(axis=0)} to {vertices.max(axis=0)}")
+            return interleaved, indices
 
-            # Center at origin
-            center = vertices.mean(axis=0)
-            vertices = vertices - center
+        except Exception as e:
+            print(f"  Error loading with trimesh: {e}")
+            if config.DEBUG_MODE:
+                traceback.print_exc()
+            return None
 
+    def _build_model_node(self, interleaved, indices):
+        """Build a Panda3D node from prepared arrays (must run on the main thread)."""
+        try:
             # Create Panda3D GeomNode
             geom_node = GeomNode('model')
 
             # Create vertex data
-            vformat = GeomVertexFormat.getV3n3()
-            vdata = GeomVertexData('vertices', vformat, Geom.UHStatic)
-            vdata.setNumRows(len(vertices))
-
-            vertex_writer = GeomVertexWriter(vdata, 'vertex')
-            normal_writer = GeomVertexWriter(vdata, 'normal')
-
-            for i, vert in enumerate(vertices):
-                # Swap Y and Z for Panda3D (GLB Z-up -> Panda3D Y-forward)
-                vertex_writer.addData3f(float(vert[0]), float(vert[2]), float(vert[1]))
-                n = normals[i]
-                normal_writer.addData3f(float(n[0]), float(n[2]), float(n[1]))
+            vdata = GeomVertexData('vertices', self._V3N3_FORMAT, Geom.UHStatic)
+            vdata.uncleanSetNumRows(len(interleaved))
+            vbuffer = memoryview(vdata.modifyArray(0)).cast('B').cast('f')
+            vbuffer[:] = interleaved.ravel()
 
-            # Create triangles
+            # Create triangles, copying the whole index buffer at once
             tris = GeomTriangles(Geom.UHStatic)
-            for face in faces:
-                tris.addVertices(int(face[0]), int(face[1]), int(face[2]))
-            tris.closePrimitive()
+            if indices.itemsize == 2:
+                tris.setIndexType(Geom.NT_uint16)
+            else:
+                tris.setIndexType(Geom.NT_uint32)
+            index_array = tris.modifyVertices()
+            index_array.uncleanSetNumRows(len(indices))
+            memoryview(index_array).cast('B').cast(indices.dtype.char)[:] = indices
 
             geom = Geom(vdata)
             geom.addPrimitive(tris)
             geom_node.addGeom(geom)
 
             node_path = NodePath(geom_node)
-            print(f"  ✓ Created Panda3D node with {len(vertices)} vertices")
+            print(f"  ✓ Created Panda3D node with {len(interleaved)} vertices")
 
             return node_path
 
         except Exception as e:
-            import traceback
-            print(f"  Error loading with trimesh: {e}")
-            traceback.print_exc()
+            print(f"  Error building model geometry: {e}")
+            if config.DEBUG_MODE:
+                traceback.print_exc()
             return None
 
     def _load_characters(self):
         """Load 4 character models with positions and colors."""
-        for char_id, config in CHARACTER_CONFIG.items():
-            model_path = config['model']
-            pos = config['position']
+        # Several suspects share a model file; load each file once and
+        # instance the geometry under every character that uses it
+        models = {}
+
+        # Parse the distinct model files in parallel (trimesh and numpy do
+        # most of their work outside the GIL); Panda3D geometry is still
+        # built below on the main thread
+        model_paths = [
+            path for path in dict.fromkeys(c['model'] for c in CHARACTER_CONFIG.values())
+            if os.path.exists(path)
+        ]
+        prepared = {}
+        if model_paths:
+            print(f"Loading character models: {', '.join(model_paths)}")
+            with ThreadPoolExecutor(max_workers=len(model_paths)) as pool:
+                results = list(pool.map(self._prepare_model_arrays, model_paths))
+            prepared = {path: arrays for path, (arrays, _) in zip(model_paths, results)}
+
+            # trimesh scenes are full of reference cycles; collect them once
+            # here rather than from each worker or in a later frame. Models
+            # that all came from the cache built no scenes to collect.
+            if any(parsed for _, parsed in results):
+                gc.collect()
+
+        for char_id, char_config in CHARACTER_CONFIG.items():
+            model_path = char_config['model']
+            pos = char_config['position']
 
             char_node = None
 
-            if os.path.exists(model_path):
-                print(f"Loading {config['name']} from {model_path}...")
-
+            if model_path not in models and model_path in prepared:
                 # Try trimesh loader first (bypasses Panda3D's broken GLB support)
-                char_node = self._load_model_with_trimesh(model_path)
+                arrays = prepared[model_path]
+                models[model_path] = self._build_model_node(*arrays) if arrays else None
 
-                if char_node:
-                    # FIX: Rotate to stand upright BEFORE attaching to scene
-                    #char_node.setP(-90)  # Pitch -90 to stand vertical
+                if models[model_path] is None:
+                    print(f"  Trimesh failed, using placeholder")
 
-                    char_node.reparentTo(self.base.render)
+            model = models.get(model_path)
+            if model is not None:
+                # Per-character parent holds the transform and tint, so the
+                # shared geometry itself is never modified
+                char_node = self.base.render.attachNewNode(f'character_{char_id}')
+                model.instanceTo(char_node)
 
-                    # Position character
-                    char_node.setPos(pos[0], pos[1], 0)
+                # FIX: Rotate to stand upright BEFORE attaching to scene
+                #char_node.setP(-90)  # Pitch -90 to stand vertical
 
-                    # Scale larger for visibility
-                    char_node.setScale(1.5)
+                # Position character
+                char_node.setPos(pos[0], pos[1], 0)
 
-                    # Apply color tint
-                    char_node.setColor(*config['color'])
+                # Scale larger for visibility
+                char_node.setScale(1.5)
 
-                    print(f"✓ Loaded {config['name']} with trimesh")
-                else:
-                    print(f"  Trimesh failed, using placeholder")
+                # Apply color tint
+                char_node.setColor(*char_config['color'])
+
+                print(f"✓ Loaded {char_config['name']} with trimesh")
 
             if char_node is None:
                 # Fallback: create VISIBLE placeholder geometry
                 char_node = self._create_placeholder_character()
                 char_node.reparentTo(self.base.render)
                 char_node.setPos(pos[0], pos[1], 0)
-                char_node.setH(config['heading'])
-                char_node.setColor(*config['color'])
-                print(f"⚠ Using placeholder for {config['name']} at {pos}")
+                char_node.setH(char_config['heading'])
+                char_node.setColor(*char_config['color'])
+                print(f"⚠ Using placeholder for {char_config['name']} at {pos}")
 
             self.characters[char_id] = char_node
 
@@ -283,8 +471,6 @@ class Scene3D:
 
     def _create_placeholder_character(self):
         """Create a visible placeholder for missing character models."""
-        from panda3d.core import GeomVertexFormat, GeomVertexData, Geom, GeomTriangles, GeomVertexWriter, GeomNode
-
         # Create a simple 3D box as placeholder (more visible than a card)
         card = CardMaker('placeholder')
         card.setFrame(-0.4, 0.4, 0, 1.8)  # Wider and taller
@@ -336,6 +522,11 @@ class Scene3D:
             print(f"Warning: Unknown character {character_id}")
             return
 
+        # Already facing this character; restarting would just snap the
+        # running interval to its end and replay it
+        if character_id == self.focused_character:
+            return
+
         # Stop any existing animation
         if self._camera_interval:
             self._camera_interval.finish()
@@ -368,6 +559,10 @@ class Scene3D:
 
     def reset_camera(self, duration: float = 0.8):
         """Reset camera to neutral forward-facing position."""
+        # Already reset (or resetting) to neutral
+        if self.focused_character is None and self._camera_interval is not None:
+            return
+
         if self._camera_interval:
             self._camera_interval.finish()
 
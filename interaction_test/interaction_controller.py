@@ -4,6 +4,8 @@ Handles user input, LLM communication, and UI display.
 """
 import sys
 import os
+import queue
+import threading
 from typing import Optional
 
 from direct.showbase.ShowBase import ShowBase
@@ -44,6 +46,8 @@ class InteractionController:
         )
 
         self.is_waiting_for_response = False
+        # Worker thread posts (response, error) here; polled from a task
+        self._response_queue: queue.Queue = queue.Queue()
 
         self._setup_ui()
         self._setup_input_handlers()
@@ -154,26 +158,37 @@ class InteractionController:
         # Mark as waiting
         self.is_waiting_for_response = True
 
-        # Schedule LLM response generation
-        self.base.taskMgr.doMethodLater(
-            0.1,
-            self._generate_response,
-            'generate_llm_response'
-        )
+        # Generate the LLM response on a worker thread so the window keeps
+        # rendering while the request is in flight
+        threading.Thread(target=self._request_response, daemon=True).start()
+        self.base.taskMgr.add(self._poll_response, 'poll_llm_response')
+
+    def _request_response(self) -> None:
+        """Call the LLM provider (runs on a worker thread)."""
+        try:
+            response = self.llm_provider.generate_response(self.conversation)
+            self._response_queue.put((response, None))
+        except Exception as e:
+            self._response_queue.put((None, e))
 
-    def _generate_response(self, task) -> int:
+    def _poll_response(self, task) -> int:
         """
-        Generate LLM response (called asynchronously).
+        Check for a finished LLM response (called every frame).
 
         Args:
             task: Panda3D task object
 
         Returns:
-            Task done status
+            Task cont status until a response arrives, then done
         """
         try:
-            # Generate response from LLM
-            response = self.llm_provider.generate_response(self.conversation)
+            response, error = self._response_queue.get_nowait()
+        except queue.Empty:
+            return task.cont
+
+        try:
+            if error is not None:
+                raise error
 
             # Add assistant response to conversation history
             self.conversation.add_message('assistant', response)
@@ -235,7 +250,7 @@ class InteractionController:
     def _display_conversation(self) -> None:
         """Display the recent conversation history."""
         # Get last few exchanges
-        messages_to_show = self.conversation.messages[-4:]  # Last 2 exchanges (4 messages)
+        messages_to_show = list(self.conversation.messages)[-4:]  # Last 2 exchanges (4 messages)
 
         display_text = []
         for msg in messages_to_show:
@@ -8,6 +8,7 @@ Tests LLM integration with a single character in a simple 3D scene.
 import sys
 import os
 import argparse
+import importlib.util
 from pathlib import Path
 
 # Add parent directory to path to import modules
@@ -161,24 +162,12 @@ def check_dependencies() -> list[str]:
     Returns:
         List of missing dependencies
     """
-    missing = []
-
-    try:
-        import panda3d
-    except ImportError:
-        missing.append('panda3d')
-
-    try:
-        import trimesh
-    except ImportError:
-        missing.append('trimesh')
-
-    try:
-        import numpy
-    except ImportError:
-        missing.append('numpy')
-
-    return missing
+    # find_spec locates the packages without executing them, so checking
+    # dependencies doesn't page in numpy/trimesh before the app starts
+    return [
+        name for name in ('panda3d', 'trimesh', 'numpy')
+        if importlib.util.find_spec(name) is None
+    ]
 
 
 def main():
@@ -42,9 +42,8 @@ class QuickTest(ShowBase):
                 bounds = model.getTightBounds()
                 if bounds:
                     min_pt, max_pt = bounds
-                    width = max_pt.x - min_pt.x
-                    depth = max_pt.y - min_pt.y
-                    height = max_pt.z - min_pt.z
+                    size = max_pt - min_pt
+                    width, depth, height = size
 
                     print(f"\nBOUNDS:")
                     print(f"  Min: ({min_pt.x:.3f}, {min_pt.y:.3f}, {min_pt.z:.3f})")
@@ -52,9 +51,9 @@ class QuickTest(ShowBase):
                     print(f"  Dimensions: W={width:.3f}, D={depth:.3f}, H={height:.3f}")
 
                     # Check if reasonable
-                    if width > 100 or depth > 100 or height > 100:
+                    if max(size) > 100:
                         print("  ⚠ WARNING: Model is very large! (>100 units)")
-                    elif width < 0.01 or depth < 0.01 or height < 0.01:
+                    elif min(size) < 0.01:
                         print("  ⚠ WARNING: Model is very small! (<0.01 units)")
                     else:
                         print("  ✓ Dimensions look reasonable")
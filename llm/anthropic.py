@@ -19,14 +19,12 @@ class AnthropicProvider(LLMProvider):
             return "[Error: ANTHROPIC_API_KEY not set]"
 
         try:
-            import requests
-
             # Anthropic uses a different message format
             messages = []
             for msg in conversation.messages:
                 messages.append({"role": msg.role, "content": msg.content})
 
-            response = requests.post(
+            response = self._http_session().post(
                 "https://api.anthropic.com/v1/messages",
                 headers={
                     "x-api-key": self.api_key,
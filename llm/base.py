@@ -3,10 +3,11 @@ Base classes and data structures for LLM providers.
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a conversation message."""
     role: str  # 'system', 'user', or 'assistant'
@@ -17,15 +18,17 @@ class Message:
 class ConversationHistory:
     """Maintains conversation history for a character."""
     system_prompt: str
-    messages: list[Message] = field(default_factory=list)
+    messages: deque[Message] = field(default_factory=deque)
     max_history: int = 10  # Keep last N exchanges to manage context
 
+    def __post_init__(self):
+        # Bounded deque drops the oldest message on append once the history
+        # is full (system prompt is kept separately)
+        self.messages = deque(self.messages, maxlen=self.max_history * 2)
+
     def add_message(self, role: str, content: str):
         """Add a message to the history."""
         self.messages.append(Message(role=role, content=content))
-        # Trim history if too long (keep system prompt separate)
-        if len(self.messages) > self.max_history * 2:
-            self.messages = self.messages[-(self.max_history * 2):]
 
     def get_messages_for_api(self) -> list[dict]:
         """Format messages for API calls."""
@@ -38,6 +41,14 @@ class ConversationHistory:
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    def _http_session(self):
+        """Get a requests session shared across calls (keeps connections alive)."""
+        session = getattr(self, '_session', None)
+        if session is None:
+            import requests
+            session = self._session = requests.Session()
+        return session
+
     @abstractmethod
     def generate_response(self, conversation: ConversationHistory) -> str:
         """Generate a response given the conversation history."""
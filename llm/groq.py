@@ -19,11 +19,9 @@ class GroqProvider(LLMProvider):
             return "[Error: GROQ_API_KEY not set]"
 
         try:
-            import requests
-
             messages = conversation.get_messages_for_api()
 
-            response = requests.post(
+            response = self._http_session().post(
                 "https://api.groq.com/openai/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
@@ -2,6 +2,8 @@
 Mock LLM provider for testing without an actual LLM.
 """
 
+from typing import Optional
+
 from .base import LLMProvider, ConversationHistory
 
 
@@ -32,15 +34,12 @@ class MockLLMProvider(LLMProvider):
             ],
         }
         self.response_index = {"major": 0, "lady": 0, "maid": 0, "student": 0}
+        # System prompt -> detected character id (prompts never change per conversation)
+        self._character_cache: dict[str, Optional[str]] = {}
 
     def generate_response(self, conversation: ConversationHistory) -> str:
         """Return a pre-written response based on character."""
-        # Detect character from system prompt
-        character_id = None
-        for cid in self.response_templates.keys():
-            if cid in conversation.system_prompt.lower():
-                character_id = cid
-                break
+        character_id = self._detect_character(conversation.system_prompt)
 
         if character_id is None:
             return "I... I'm not sure what to say, Inspector."
@@ -50,5 +49,20 @@ class MockLLMProvider(LLMProvider):
         self.response_index[character_id] += 1
         return responses[idx]
 
+    def _detect_character(self, system_prompt: str) -> Optional[str]:
+        """Detect which character a system prompt belongs to, caching the result."""
+        if system_prompt in self._character_cache:
+            return self._character_cache[system_prompt]
+
+        prompt_lower = system_prompt.lower()
+        character_id = None
+        for cid in self.response_templates.keys():
+            if cid in prompt_lower:
+                character_id = cid
+                break
+
+        self._character_cache[system_prompt] = character_id
+        return character_id
+
     def is_available(self) -> bool:
         return True
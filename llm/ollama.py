@@ -15,11 +15,9 @@ class OllamaProvider(LLMProvider):
     def generate_response(self, conversation: ConversationHistory) -> str:
         """Generate response using Ollama."""
         try:
-            import requests
-
             messages = conversation.get_messages_for_api()
 
-            response = requests.post(
+            response = self._http_session().post(
                 f"{self.host}/api/chat",
                 json={
                     "model": self.model,
@@ -46,8 +44,7 @@ class OllamaProvider(LLMProvider):
     def is_available(self) -> bool:
         """Check if Ollama is running."""
         try:
-            import requests
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
+            response = self._http_session().get(f"{self.host}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception:
             return False
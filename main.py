@@ -18,6 +18,7 @@ Usage:
 """
 
 import argparse
+import importlib.util
 import sys
 
 
@@ -80,11 +81,12 @@ def check_dependencies():
     missing = []
     available = []
 
+    # find_spec only locates the package; importing pygame here would load
+    # its native libraries even when the terminal UI is selected
     for package, description in dependencies.items():
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             available.append(f"  [OK] {package} - {description}")
-        except ImportError:
+        else:
             missing.append(f"  [--] {package} - {description}")
 
     if available or missing:
@@ -7,9 +7,18 @@ This module provides three UI options:
 - Panda3D: Full 3D interactive UI
 """
 
-from .terminal import TerminalUI, run_terminal_game
-from .pygame_ui import PygameUI, run_pygame_game
-from .panda3d_ui import PandaMysteryGame, run_panda3d_game
+import importlib
+
+# Exported name -> submodule. Submodules are imported on first access so
+# that e.g. the terminal UI doesn't pull in pygame and Panda3D at startup.
+_EXPORTS = {
+    'TerminalUI': 'terminal',
+    'run_terminal_game': 'terminal',
+    'PygameUI': 'pygame_ui',
+    'run_pygame_game': 'pygame_ui',
+    'PandaMysteryGame': 'panda3d_ui',
+    'run_panda3d_game': 'panda3d_ui',
+}
 
 __all__ = [
     'TerminalUI',
@@ -19,3 +28,13 @@ __all__ = [
     'run_pygame_game',
     'run_panda3d_game',
 ]
+
+
+def __getattr__(name):
+    """Import the submodule that provides an exported name on first access."""
+    if name in _EXPORTS:
+        module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
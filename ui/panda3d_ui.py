@@ -3,7 +3,9 @@
 Panda3D 3D UI for The Pemberton Manor Mystery.
 Provides immersive first-person 3D experience with game engine integration.
 """
+import queue
 import sys
+import threading
 from direct.showbase.ShowBase import ShowBase
 from direct.gui.DirectGui import (
     DirectFrame, DirectLabel, DirectButton, DirectScrolledList,
@@ -27,6 +29,9 @@ CHAR_NUM_MAP = {
 
 CHAR_ID_TO_NUM = {v: k for k, v in CHAR_NUM_MAP.items()}
 
+# Seconds between game-state checks in the update task
+UPDATE_INTERVAL = 0.1
+
 
 class PandaMysteryGame(ShowBase):
     """Main Panda3D game application."""
@@ -52,14 +57,21 @@ class PandaMysteryGame(ShowBase):
         self.current_response = ""
         self.show_notebook = False
 
+        # LLM calls can take seconds, so questions are answered on a daemon
+        # worker thread (which never holds up quitting) that posts
+        # (response, error) here; only one question is in flight at a time
+        self._answer_queue: queue.Queue = queue.Queue()
+        self._waiting_for_answer = False
+
         # Setup UI
         self._setup_ui()
 
         # Setup input
         self._setup_input()
 
-        # Update loop
-        self.taskMgr.add(self.update, 'update')
+        # Update loop - it only watches for game over, so poll a few times
+        # a second instead of running every frame
+        self.taskMgr.doMethodLater(UPDATE_INTERVAL, self.update, 'update')
 
         print("✓ Panda3D Mystery Game initialized")
         print("Controls: [1-4] Select character, [N] Notebook, [A] Accuse, [ESC] Quit")
@@ -170,6 +182,8 @@ class PandaMysteryGame(ShowBase):
 
     def select_character(self, num: str):
         """Handle character selection."""
+        if self._waiting_for_answer:
+            return
         if self.engine.session.state != GameState.INVESTIGATING:
             return
 
@@ -194,6 +208,8 @@ class PandaMysteryGame(ShowBase):
 
     def prompt_question(self):
         """Prompt user to type a question (simplified - uses predefined questions)."""
+        if self._waiting_for_answer:
+            return
         if self.engine.session.current_character is None:
             self.response_label['text'] = "Select a character first [1-4]"
             return
@@ -204,13 +220,42 @@ class PandaMysteryGame(ShowBase):
         char_name = self.scene.get_character_name(char_id)
 
         # Ask about alibi (common question)
-        response = self.engine.ask_question("Where were you at the time of the murder?")
+        self.response_label['text'] = f"{char_name} considers your question..."
+        self._waiting_for_answer = True
+        threading.Thread(
+            target=self._request_answer,
+            args=("Where were you at the time of the murder?",),
+            daemon=True,
+        ).start()
+        self.taskMgr.add(self._poll_answer, 'poll_answer')
+
+    def _request_answer(self, question: str):
+        """Ask the engine a question (runs on a worker thread)."""
+        try:
+            self._answer_queue.put((self.engine.ask_question(question), None))
+        except Exception as e:
+            self._answer_queue.put((None, e))
+
+    def _poll_answer(self, task):
+        """Show the pending answer once the worker has finished."""
+        try:
+            response, error = self._answer_queue.get_nowait()
+        except queue.Empty:
+            return task.cont
+
+        self._waiting_for_answer = False
+        if error is not None:
+            response = f"[Error: {error}]"
+
         self.response_label['text'] = response[:500]  # Truncate for display
         self._update_question_counter()
         self._update_notebook()
+        return task.done
 
     def go_back(self):
         """Go back to character selection."""
+        if self._waiting_for_answer:
+            return
         if self.engine.session.current_character:
             self.engine.session.current_character = None
             self.scene.reset_camera()
@@ -242,6 +287,8 @@ class PandaMysteryGame(ShowBase):
 
     def start_accusation(self):
         """Start the accusation phase."""
+        if self._waiting_for_answer:
+            return
         if self.engine.session.state != GameState.INVESTIGATING:
             return
 
@@ -255,10 +302,13 @@ class PandaMysteryGame(ShowBase):
         """Main update loop."""
         # Check for game over conditions
         if self.engine.session and self.engine.session.state == GameState.GAME_OVER:
-            if self.engine.session.result:
-                self.response_label['text'] = self.engine.session.result
+            result = self.engine.session.result
+            # Setting DirectLabel text regenerates its TextNode, so only
+            # assign when the shown text would actually change
+            if result and self.response_label['text'] != result:
+                self.response_label['text'] = result
 
-        return task.cont
+        return task.again
 
 
 def run_panda3d_game():
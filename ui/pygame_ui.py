@@ -3,7 +3,9 @@ Pygame-based graphical UI for the Victorian Murder Mystery game.
 Provides a visual representation of the drawing room with character portraits.
 """
 
+import queue
 import sys
+import threading
 from typing import Optional, Callable
 from dataclasses import dataclass
 
@@ -27,6 +29,9 @@ class CharacterAnimationState:
         self.animation_progress = 1.0  # 0.0 = starting, 1.0 = complete
         self.animation_duration = 0.6  # seconds
         self.animation_start_time = 0
+        # Eased progress is shared by every sprite, so compute it once per
+        # update instead of once per character drawn
+        self._eased_progress = 1.0
 
     def start_focus(self, character_id):
         """Start focusing on a character (or None for neutral)."""
@@ -34,6 +39,7 @@ class CharacterAnimationState:
         if character_id != self.focused_char:
             self.focused_char = character_id
             self.animation_progress = 0.0
+            self._eased_progress = 0.0
             self.animation_start_time = time.time()
 
     def update(self):
@@ -44,15 +50,20 @@ class CharacterAnimationState:
         import time
         elapsed = time.time() - self.animation_start_time
         self.animation_progress = min(1.0, elapsed / self.animation_duration)
+        self._eased_progress = self._ease(self.animation_progress)
 
-    def get_eased_progress(self):
-        """Get eased animation progress (ease-in-out quadratic)."""
-        t = self.animation_progress
+    @staticmethod
+    def _ease(t):
+        """Ease-in-out quadratic."""
         if t < 0.5:
             return 2 * t * t
         else:
             return 1 - pow(-2 * t + 2, 2) / 2
 
+    def get_eased_progress(self):
+        """Get eased animation progress (ease-in-out quadratic)."""
+        return self._eased_progress
+
 
 @dataclass
 class CharacterSprite:
@@ -112,6 +123,9 @@ class PygameUI:
         self.input_text = ""
         self.dialogue_text = ""
         self.current_speaker = None
+        # Rendered dialogue, rebuilt only when set_dialogue changes it
+        self._speaker_surface: Optional[Surface] = None
+        self._dialogue_surfaces: list[Surface] = []
         self.game_messages: list[str] = []
         self.selected_character: Optional[str] = None
         self.clock = pygame.time.Clock()
@@ -119,6 +133,16 @@ class PygameUI:
         # Phase 1.5: Animation state for focus effects
         self.anim_state = CharacterAnimationState()
 
+        # Room and table never change, so they are drawn once and reused
+        self._static_layer: Optional[Surface] = None
+
+        # Rendered name and "[n]" labels per character; their text and
+        # colour never change, so each is rendered once
+        self._character_labels: dict[str, tuple[Surface, Surface]] = {}
+
+        # Set whenever something visible changes; idle frames skip render()
+        self._dirty = True
+
     def draw_background(self):
         """Draw the drawing room background."""
         self.screen.fill(self.COLORS['background'])
@@ -220,16 +244,27 @@ class PygameUI:
         # Blit character surface
         self.screen.blit(char_surface, (x - char_surface.get_width() // 2, y - int(60 * scale)))
 
+        text, num_text = self._get_character_labels(char_id, sprite)
+
         # Name label
-        text = self.font_small.render(sprite.name, True, self.COLORS['text'])
         text_rect = text.get_rect(center=(x, y + int(50 * scale)))
         self.screen.blit(text, text_rect)
 
         # Number for selection
-        char_nums = {'major': '1', 'lady': '2', 'maid': '3', 'student': '4'}
-        num_text = self.font_medium.render(f"[{char_nums[char_id]}]", True, self.COLORS['highlight'])
         self.screen.blit(num_text, (x - 15, y + int(70 * scale)))
 
+    def _get_character_labels(self, char_id: str, sprite: CharacterSprite) -> tuple[Surface, Surface]:
+        """Get a character's rendered name and selection number, rendering them once."""
+        labels = self._character_labels.get(char_id)
+        if labels is None:
+            char_nums = {'major': '1', 'lady': '2', 'maid': '3', 'student': '4'}
+            labels = (
+                self.font_small.render(sprite.name, True, self.COLORS['text']),
+                self.font_medium.render(f"[{char_nums[char_id]}]", True, self.COLORS['highlight']),
+            )
+            self._character_labels[char_id] = labels
+        return labels
+
     def draw_detective(self):
         """Draw the detective (player) figure."""
         x, y = self.width // 2, 550
@@ -252,28 +287,27 @@ class PygameUI:
         pygame.draw.rect(self.screen, self.COLORS['input_bg'], box_rect)
         pygame.draw.rect(self.screen, self.COLORS['text_dim'], box_rect, 2)
 
-        if self.current_speaker:
-            speaker_text = self.font_medium.render(f"{self.current_speaker}:", True, self.COLORS['highlight'])
-            self.screen.blit(speaker_text, (30, self.height - 195))
-
-        if self.dialogue_text:
-            # Word wrap the dialogue
-            words = self.dialogue_text.split()
-            lines = []
-            current_line = ""
-            for word in words:
-                test_line = current_line + " " + word if current_line else word
-                if self.font_small.size(test_line)[0] < self.width - 80:
-                    current_line = test_line
-                else:
-                    lines.append(current_line)
-                    current_line = word
-            if current_line:
+        if self._speaker_surface:
+            self.screen.blit(self._speaker_surface, (30, self.height - 195))
+
+        for i, text in enumerate(self._dialogue_surfaces):
+            self.screen.blit(text, (30, self.height - 165 + i * 25))
+
+    def _wrap_dialogue(self, text: str) -> list[str]:
+        """Word wrap dialogue text to the width of the dialogue box."""
+        words = text.split()
+        lines = []
+        current_line = ""
+        for word in words:
+            test_line = current_line + " " + word if current_line else word
+            if self.font_small.size(test_line)[0] < self.width - 80:
+                current_line = test_line
+            else:
                 lines.append(current_line)
-
-            for i, line in enumerate(lines[:4]):  # Max 4 lines
-                text = self.font_small.render(line, True, self.COLORS['text'])
-                self.screen.blit(text, (30, self.height - 165 + i * 25))
+                current_line = word
+        if current_line:
+            lines.append(current_line)
+        return lines
 
     def draw_input_box(self):
         """Draw the text input box."""
@@ -310,8 +344,12 @@ class PygameUI:
         # Phase 1.5: Update animation state each frame
         self.anim_state.update()
 
-        self.draw_background()
-        self.draw_table()
+        if self._static_layer is None:
+            self.draw_background()
+            self.draw_table()
+            self._static_layer = self.screen.copy()
+        else:
+            self.screen.blit(self._static_layer, (0, 0))
 
         # Draw characters
         for char_id, sprite in self.characters.items():
@@ -324,15 +362,32 @@ class PygameUI:
         self.draw_input_box()
 
         pygame.display.flip()
+        self._dirty = False
+
+    def needs_render(self) -> bool:
+        """Whether the next frame differs from the one on screen."""
+        return self._dirty or self.anim_state.animation_progress < 1.0
 
     def set_dialogue(self, speaker: str, text: str):
         """Set the current dialogue text."""
         self.current_speaker = speaker
         self.dialogue_text = text
+        self._dirty = True
+
+        # Wrap and render once here rather than on every frame
+        self._speaker_surface = (
+            self.font_medium.render(f"{speaker}:", True, self.COLORS['highlight'])
+            if speaker else None
+        )
+        self._dialogue_surfaces = [
+            self.font_small.render(line, True, self.COLORS['text'])
+            for line in self._wrap_dialogue(text)[:4]  # Max 4 lines
+        ] if text else []
 
     def set_selected_character(self, char_id: Optional[str]):
         """Set which character is currently selected."""
         self.selected_character = char_id
+        self._dirty = True
         # Phase 1.5: Start focus animation
         self.anim_state.start_focus(char_id)
 
@@ -342,6 +397,9 @@ class PygameUI:
         Returns (running, input_text) where input_text is None unless Enter was pressed.
         """
         for event in pygame.event.get():
+            # Any event (typing, window expose, focus) may change the frame
+            self._dirty = True
+
             if event.type == pygame.QUIT:
                 return False, None
 
@@ -360,12 +418,18 @@ class PygameUI:
 
         return True, None
 
-    def run_game_loop(self, process_input: Callable[[str], str]):
+    def run_game_loop(
+        self,
+        process_input: Callable[[str], str],
+        will_query_llm: Optional[Callable[[str], bool]] = None,
+    ):
         """
         Main game loop for pygame UI.
 
         Args:
             process_input: Function that takes user input and returns game response
+            will_query_llm: Optional function telling whether an input goes to
+                the LLM, so a "Thinking..." placeholder is shown only for those
         """
         running = True
 
@@ -373,11 +437,41 @@ class PygameUI:
         intro_response = process_input("start")
         self.set_dialogue("Game", "Welcome to Pemberton Manor. Select a suspect (1-4) to begin questioning.")
 
+        # Answers can take seconds to come back from the LLM, so input is
+        # processed on a daemon worker thread (which never holds up quitting)
+        # that posts (input, response, error) here while this loop keeps drawing
+        responses: queue.Queue = queue.Queue()
+        waiting = False
+
+        def request_response(text: str):
+            try:
+                responses.put((text, process_input(text), None))
+            except Exception as e:
+                responses.put((text, None, e))
+
         while running:
             running, user_input = self.handle_events()
 
             if user_input is not None and user_input.strip():
-                response = process_input(user_input)
+                if not waiting:
+                    waiting = True
+                    if will_query_llm is not None and will_query_llm(user_input):
+                        self.set_dialogue("System", "Thinking...")
+                    threading.Thread(
+                        target=request_response, args=(user_input,), daemon=True
+                    ).start()
+                else:
+                    # Still waiting on the last answer; keep what was typed
+                    self.input_text = user_input
+
+            try:
+                user_input, response, error = responses.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                waiting = False
+                if error is not None:
+                    response = f"[Error: {error}]"
 
                 # Parse response for speaker/dialogue
                 if ":" in response and '"' in response:
@@ -393,7 +487,8 @@ class PygameUI:
                 if user_input.strip() in char_map:
                     self.set_selected_character(char_map[user_input.strip()])
 
-            self.render()
+            if self.needs_render():
+                self.render()
             self.clock.tick(config.FPS)
 
         pygame.quit()
@@ -418,7 +513,11 @@ def run_pygame_game():
             return engine.start_new_game()
         return engine.process_input(user_input)
 
-    ui.run_game_loop(process_input)
+    def will_query_llm(user_input: str) -> bool:
+        # "start" is handled above without going through the engine's routing
+        return user_input != "start" and engine.will_query_llm(user_input)
+
+    ui.run_game_loop(process_input, will_query_llm)
 
 
 if __name__ == "__main__":